@@ -1,11 +1,14 @@
 import sys
 import os
-import sqlite3
+import queue
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 import pandas as pd
 import yfinance as yf
 from pycoingecko import CoinGeckoAPI
-from datetime import datetime, timezone, date
+from datetime import datetime, timezone, date, timedelta
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QDate
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton,
@@ -16,117 +19,147 @@ from PyQt5.QtWidgets import (
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import matplotlib.pyplot as plt
 
-DB_FILE = "crypto_cache.db"
-
-def init_db():
-    conn = sqlite3.connect(DB_FILE)
-    cur = conn.cursor()
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS crypto_prices (
-            coin_id TEXT NOT NULL,
-            Date TEXT NOT NULL,
-            price REAL,
-            PRIMARY KEY (coin_id, Date)
-        )
-    """)
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS fiat_rates (
-            code TEXT NOT NULL,
-            Date TEXT NOT NULL,
-            Close REAL,
-            PRIMARY KEY (code, Date)
-        )
-    """)
-    conn.commit()
-    conn.close()
-
-def save_crypto_cache(coin_id, df):
+CACHE_DIR = "cache"
+NS_PER_DAY = 86_400_000_000_000
+
+def init_cache():
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+def crypto_cache_path(coin_id, vs_currency):
+    return os.path.join(CACHE_DIR, f"crypto_{coin_id}_{vs_currency}.parquet")
+
+def fiat_cache_path(code, base_currency):
+    return os.path.join(CACHE_DIR, f"fiat_{code}_{base_currency}.parquet")
+
+def normalize_crypto_history(df):
     if df is None or df.empty:
-        return
-    conn = sqlite3.connect(DB_FILE)
-    cur = conn.cursor()
-    tmp = df.copy()
-    if "timestamp" in tmp.columns:
-        tmp["Date"] = pd.to_datetime(tmp["timestamp"]).dt.date
-    elif "Date" in tmp.columns:
-        tmp["Date"] = pd.to_datetime(tmp["Date"]).dt.date
+        return pd.DataFrame()
+    if "timestamp" in df.columns:
+        dates_src = df["timestamp"]
+    elif "Date" in df.columns:
+        dates_src = df["Date"]
+    else:
+        dates_src = df.index
+    if "price" in df.columns:
+        values_src = df["price"]
+    elif "Close" in df.columns:
+        values_src = df["Close"]
+    elif df.shape[1] >= 2:
+        values_src = df.iloc[:, 1]
     else:
-        tmp = tmp.reset_index()
-        tmp["Date"] = pd.to_datetime(tmp.iloc[:, 0]).dt.date
-    if "price" not in tmp.columns and "Close" in tmp.columns:
-        tmp["price"] = tmp["Close"]
-    if "price" not in tmp.columns and tmp.shape[1] >= 2:
-        tmp["price"] = tmp.iloc[:, 1]
-    rows = []
-    for _, r in tmp.iterrows():
-        try:
-            d = r["Date"].isoformat()
-            price = float(r["price"]) if pd.notna(r.get("price")) else None
-            rows.append((coin_id, d, price))
-        except Exception:
-            continue
-    if rows:
-        cur.executemany("INSERT OR REPLACE INTO crypto_prices (coin_id, Date, price) VALUES (?, ?, ?)", rows)
-        conn.commit()
-    conn.close()
-
-def load_crypto_cache(coin_id, start_date, end_date):
-    conn = sqlite3.connect(DB_FILE)
-    q = """
-        SELECT Date, price FROM crypto_prices
-        WHERE coin_id = ?
-        AND Date BETWEEN ? AND ?
-        ORDER BY Date ASC
-    """
-    df = pd.read_sql_query(q, conn, params=(coin_id, start_date.isoformat(), end_date.isoformat()))
-    conn.close()
-    if df.empty:
         return pd.DataFrame()
-    df["Date"] = pd.to_datetime(df["Date"])
-    return df.rename(columns={"Date": "timestamp"})
+    dates = pd.DatetimeIndex(pd.to_datetime(dates_src, errors="coerce", cache=True))
+    prices = pd.to_numeric(values_src, errors="coerce").to_numpy(dtype=np.float32)
+    mask = ~dates.isna() & np.isfinite(prices)
+    day = (dates.asi8 // NS_PER_DAY)[mask].astype(np.int32)
+    return pd.DataFrame({"day": day, "price": prices[mask]})
 
-def save_fiat_cache(code, df):
+def normalize_fiat_history(df):
     if df is None or df.empty:
-        return
-    conn = sqlite3.connect(DB_FILE)
-    cur = conn.cursor()
-    tmp = df.copy()
-    if "Date" in tmp.columns:
-        tmp["Date"] = pd.to_datetime(tmp["Date"]).dt.date
+        return pd.DataFrame()
+    if "Date" in df.columns:
+        dates_src = df["Date"]
     else:
-        tmp = tmp.reset_index()
-        tmp["Date"] = pd.to_datetime(tmp.iloc[:, 0]).dt.date
-    if "Close" not in tmp.columns and tmp.shape[1] >= 2:
-        tmp["Close"] = tmp.iloc[:, 1]
-    rows = []
-    for _, r in tmp.iterrows():
+        dates_src = df.index
+    if "Close" in df.columns:
+        values_src = df["Close"]
+    elif df.shape[1] >= 2:
+        values_src = df.iloc[:, 1]
+    else:
+        return pd.DataFrame()
+    dates = pd.DatetimeIndex(pd.to_datetime(dates_src, errors="coerce", cache=True))
+    closes = pd.to_numeric(values_src, errors="coerce").to_numpy(dtype=np.float32)
+    mask = ~dates.isna() & np.isfinite(closes)
+    day = (dates.asi8 // NS_PER_DAY)[mask].astype(np.int32)
+    return pd.DataFrame({"day": day, "Close": closes[mask]})
+
+def merge_cache_frame(path, new_df, date_col):
+    new_df = new_df.drop_duplicates(subset=date_col, keep="last")
+    if os.path.exists(path):
         try:
-            d = r["Date"].isoformat()
-            close = float(r["Close"]) if pd.notna(r.get("Close")) else None
-            rows.append((code, d, close))
+            old = pd.read_parquet(path)
         except Exception:
-            continue
-    if rows:
-        cur.executemany("INSERT OR REPLACE INTO fiat_rates (code, Date, Close) VALUES (?, ?, ?)", rows)
-        conn.commit()
-    conn.close()
-
-def load_fiat_cache(code, start_date, end_date):
-    conn = sqlite3.connect(DB_FILE)
-    q = """
-        SELECT Date, Close FROM fiat_rates
-        WHERE code = ?
-        AND Date BETWEEN ? AND ?
-        ORDER BY Date ASC
-    """
-    df = pd.read_sql_query(q, conn, params=(code, start_date.isoformat(), end_date.isoformat()))
-    conn.close()
+            old = pd.DataFrame()
+        if not old.empty:
+            # Range-delete then append: drop the window the new rows cover
+            # instead of hashing every key with a full drop_duplicates pass
+            lo = new_df[date_col].min()
+            hi = new_df[date_col].max()
+            old = old[(old[date_col] < lo) | (old[date_col] > hi)]
+            new_df = pd.concat([old, new_df], ignore_index=True)
+    return new_df.sort_values(date_col, ignore_index=True)
+
+def save_crypto_cache(coin_id, df, vs_currency):
+    tmp = normalize_crypto_history(df)
+    if tmp.empty:
+        return
+    path = crypto_cache_path(coin_id, vs_currency)
+    merge_cache_frame(path, tmp, "day").to_parquet(path, compression="zstd", index=False)
+
+def load_crypto_cache(coin_id, start_date, end_date, vs_currency):
+    path = crypto_cache_path(coin_id, vs_currency)
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    try:
+        df = pd.read_parquet(path, columns=["day", "price"])
+    except Exception:
+        return pd.DataFrame()
+    start_day = pd.Timestamp(start_date).value // NS_PER_DAY
+    end_day = pd.Timestamp(end_date).value // NS_PER_DAY
+    df = df[(df["day"] >= start_day) & (df["day"] <= end_day)]
     if df.empty:
         return pd.DataFrame()
-    df["Date"] = pd.to_datetime(df["Date"])
-    return df
+    return pd.DataFrame({
+        "timestamp": pd.to_datetime(df["day"].to_numpy(), unit="D"),
+        "price": df["price"].to_numpy()
+    })
+
+def save_fiat_cache(code, df, base_currency):
+    tmp = normalize_fiat_history(df)
+    if tmp.empty:
+        return
+    path = fiat_cache_path(code, base_currency)
+    merge_cache_frame(path, tmp, "day").to_parquet(path, compression="zstd", index=False)
 
-init_db()
+def load_fiat_cache(code, start_date, end_date, base_currency):
+    path = fiat_cache_path(code, base_currency)
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    try:
+        df = pd.read_parquet(path, columns=["day", "Close"])
+    except Exception:
+        return pd.DataFrame()
+    start_day = pd.Timestamp(start_date).value // NS_PER_DAY
+    end_day = pd.Timestamp(end_date).value // NS_PER_DAY
+    df = df[(df["day"] >= start_day) & (df["day"] <= end_day)]
+    if df.empty:
+        return pd.DataFrame()
+    return pd.DataFrame({
+        "Date": pd.to_datetime(df["day"].to_numpy(), unit="D"),
+        "Close": df["Close"].to_numpy()
+    })
+
+MAX_PLOT_POINTS = 2000
+
+def decimate_for_plot(x, y, max_points=MAX_PLOT_POINTS):
+    if len(y) > max_points:
+        step = -(-len(y) // max_points)  # ceiling, so the stride covers the whole series
+        return x.iloc[::step], y.iloc[::step]
+    return x, y
+
+def cached_date_range(path):
+    if not os.path.exists(path):
+        return None, None
+    try:
+        col = pd.read_parquet(path, columns=["day"])["day"]
+    except Exception:
+        return None, None
+    if col.empty:
+        return None, None
+    return (pd.to_datetime(int(col.min()), unit="D").date(),
+            pd.to_datetime(int(col.max()), unit="D").date())
+
+init_cache()
 
 class DataWorker(QThread):
     finished = pyqtSignal(dict)
@@ -140,8 +173,108 @@ class DataWorker(QThread):
         self.end_date = end_date
         self.base_currency = base_currency.upper()
         self._stopped = False
+        self._start_iso = start_date.isoformat()
+        self._end_iso = end_date.isoformat()
+        self._base_range = pd.date_range(start_date, end_date)
+        self._log_buf = []
+        self._log_lock = threading.Lock()
+        self._log_stop = threading.Event()
+        self._flusher = None
+        self._write_q = queue.Queue()
+        self._writer = None
+
+    def _drain_writes(self):
+        # Writer thread: persists histories while the fetch loop keeps going
+        while True:
+            item = self._write_q.get()
+            if item is None:
+                break
+            kind, key, df = item
+            try:
+                if kind == "crypto":
+                    save_crypto_cache(key, df, self.base_currency.lower())
+                else:
+                    save_fiat_cache(key, df, self.base_currency)
+            except Exception as e:
+                self._log(f"Failed saving cache for {key}: {e}")
+
+    def _log(self, message):
+        # Buffered; the flusher thread emits one batch every ~100ms
+        with self._log_lock:
+            self._log_buf.append(message)
+
+    def _flush_log(self):
+        with self._log_lock:
+            if not self._log_buf:
+                return
+            batch = "\n".join(self._log_buf)
+            self._log_buf.clear()
+        self.log.emit(batch)
+
+    def _drain_log(self):
+        # Flusher thread: pending lines never sit longer than the interval
+        while not self._log_stop.wait(0.1):
+            self._flush_log()
+
+    def _fetch_coin_history(self, cg, coin, vs_currency, from_ts, to_ts):
+        coin_id = coin.get("id")
+        name = coin.get("name")
+        if self._stopped:
+            return None, pd.DataFrame()
+
+        cached_df = pd.DataFrame()
+        fetch_start = self.start_date
+        try:
+            cached_min, cached_max = cached_date_range(crypto_cache_path(coin_id, vs_currency))
+            if cached_min is not None and cached_min <= self.start_date:
+                cached_df = load_crypto_cache(coin_id, self.start_date, self.end_date, vs_currency)
+                if cached_max >= self.end_date:
+                    self._log(f"Cache hit for {name}, skipping download")
+                    return self._avg_price(cached_df), cached_df
+                fetch_start = max(cached_max + timedelta(days=1), self.start_date)
+        except Exception:
+            cached_df = pd.DataFrame()
+            fetch_start = self.start_date
+
+        try:
+            if fetch_start != self.start_date:
+                from_ts = int(datetime(fetch_start.year, fetch_start.month, fetch_start.day, tzinfo=timezone.utc).timestamp())
+            hist = cg.get_coin_market_chart_range_by_id(id=coin_id, vs_currency=vs_currency, from_timestamp=from_ts, to_timestamp=to_ts)
+            prices = hist.get("prices", [])
+            if prices:
+                arr = np.asarray(prices, dtype=np.float64)
+                day = arr[:, 0].astype(np.int64) // 86_400_000
+                daily = pd.DataFrame({"day": day, "price": arr[:, 1]}).groupby("day", sort=True)["price"].mean().reset_index()
+                daily["price"] = daily["price"].astype(np.float32)
+                daily["timestamp"] = pd.to_datetime(daily["day"], unit="D", cache=True)
+                hist_df = daily[["timestamp", "price"]].dropna().reset_index(drop=True)
+            else:
+                hist_df = pd.DataFrame()
+        except Exception as e:
+            self._log(f"Failed loading {name}: {e}")
+            hist_df = pd.DataFrame()
+
+        if not cached_df.empty:
+            if hist_df.empty:
+                hist_df = cached_df
+            else:
+                hist_df = (pd.concat([cached_df, hist_df], ignore_index=True)
+                           .drop_duplicates(subset="timestamp")
+                           .sort_values("timestamp", ignore_index=True))
+        return self._avg_price(hist_df), hist_df
+
+    @staticmethod
+    def _avg_price(hist_df):
+        if hist_df is None or hist_df.empty or "price" not in hist_df.columns:
+            return None
+        prices = pd.to_numeric(hist_df["price"], errors="coerce").dropna()
+        return float(prices.mean()) if not prices.empty else None
 
     def run(self):
+        self._writer = threading.Thread(target=self._drain_writes, daemon=True)
+        self._writer.start()
+        self._flusher = threading.Thread(target=self._drain_log, daemon=True)
+        self._flusher.start()
         try:
             result = {"cryptos": [], "fiats": []}
             cg = CoinGeckoAPI()
@@ -152,45 +285,35 @@ class DataWorker(QThread):
             from_ts = int(datetime(self.start_date.year, self.start_date.month, self.start_date.day, tzinfo=timezone.utc).timestamp())
             to_ts = int(datetime(self.end_date.year, self.end_date.month, self.end_date.day, 23, 59, 59, tzinfo=timezone.utc).timestamp())
 
-            for idx, coin in enumerate(top):
-                if self._stopped:
-                    break
-                coin_id = coin.get("id")
-                name = coin.get("name")
-                self.log.emit(f"Loading data for {name} ({coin_id}) [{idx+1}/{total_coins}]")
-                try:
-                    hist = cg.get_coin_market_chart_range_by_id(id=coin_id, vs_currency=vs_currency, from_timestamp=from_ts, to_timestamp=to_ts)
-                    prices = hist.get("prices", [])
-                    df = pd.DataFrame(prices, columns=["timestamp", "price"])
-                    if not df.empty:
-                        df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
-                        df = df.set_index("timestamp").resample("1D").mean().dropna()
-                        avg_price = df["price"].mean() if not df["price"].empty else None
-                        hist_df = df.reset_index()
-                    else:
-                        avg_price = None
-                        hist_df = pd.DataFrame()
-                except Exception as e:
-                    self.log.emit(f"Failed loading {name}: {e}")
-                    avg_price = None
-                    hist_df = pd.DataFrame()
-
-                try:
-                    save_crypto_cache(coin_id, hist_df)
-                    self.log.emit(f"Saved cache for {name}")
-                except Exception as e:
-                    self.log.emit(f"Failed saving cache for {name}: {e}")
-
-                avg_price = float(avg_price) if avg_price is not None else None
-
-                result["cryptos"].append({
-                    "id": coin_id,
-                    "name": name,
-                    "avg_price": avg_price,
-                    "history": hist_df
-                })
-
-                self.progress.emit(idx + 1, total_coins)
+            crypto_results = {}
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                futs = {
+                    ex.submit(self._fetch_coin_history, cg, coin, vs_currency, from_ts, to_ts): coin
+                    for coin in top
+                }
+                done = 0
+                for fut in as_completed(futs):
+                    coin = futs[fut]
+                    coin_id = coin.get("id")
+                    name = coin.get("name")
+                    avg_price, hist_df = fut.result()
+                    done += 1
+                    self._log(f"Loaded data for {name} ({coin_id}) [{done}/{total_coins}]")
+
+                    if not hist_df.empty:
+                        self._write_q.put(("crypto", coin_id, hist_df))
+
+                    crypto_results[coin_id] = {
+                        "id": coin_id,
+                        "name": name,
+                        "avg_price": avg_price,
+                        "history": hist_df
+                    }
+
+                    self.progress.emit(done, total_coins)
+
+            # keep market-cap order regardless of completion order
+            result["cryptos"] = [crypto_results[c["id"]] for c in top if c["id"] in crypto_results]
 
             # Fiat currencies
             fiats = [
@@ -209,22 +332,55 @@ class DataWorker(QThread):
             total_fiats = len(fiats)
             total_steps = total_coins + total_fiats
 
+            fiat_cached = set()
+            for code, _ in fiats:
+                if code == self.base_currency:
+                    continue
+                try:
+                    cached_min, cached_max = cached_date_range(fiat_cache_path(code, self.base_currency))
+                    if cached_min is not None and cached_min <= self.start_date and cached_max >= self.end_date:
+                        fiat_cached.add(code)
+                except Exception:
+                    pass
+
+            tickers = [f"{code}{self.base_currency}=X" for code, _ in fiats
+                       if code != self.base_currency and code not in fiat_cached]
+            fiat_batch = pd.DataFrame()
+            if tickers and not self._stopped:
+                self._log(f"Downloading {len(tickers)} fiat tickers in one batch")
+                try:
+                    fiat_batch = yf.download(" ".join(tickers), start=self._start_iso, end=self._end_iso,
+                                             auto_adjust=True, progress=False, group_by="ticker", threads=True)
+                except Exception as e:
+                    self._log(f"Failed batch fiat download: {e}")
+                    fiat_batch = pd.DataFrame()
+
             for idx, (code, name) in enumerate(fiats):
                 if self._stopped:
                     break
-                self.log.emit(f"Loading fiat data for {name} ({code}) [{idx+1}/{total_fiats}]")
+                self._log(f"Loading fiat data for {name} ({code}) [{idx+1}/{total_fiats}]")
                 try:
                     if code == self.base_currency:
-                        idx_range = pd.date_range(self.start_date, self.end_date)
-                        df = pd.DataFrame({"Close": 1.0}, index=idx_range)
+                        df = pd.DataFrame({"Close": 1.0}, index=self._base_range)
                         avg_rate = 1.0
                         hist_df = df.reset_index().rename(columns={"index": "Date"})
+                    elif code in fiat_cached:
+                        self._log(f"Cache hit for fiat {name}, skipping download")
+                        hist_df = load_fiat_cache(code, self.start_date, self.end_date, self.base_currency)
+                        close_series = pd.to_numeric(hist_df["Close"], errors="coerce").dropna() if not hist_df.empty else pd.Series(dtype=float)
+                        avg_rate = float(close_series.mean()) if not close_series.empty else None
                     else:
                         ticker = f"{code}{self.base_currency}=X"
-                        df = yf.download(ticker, start=self.start_date, end=self.end_date, auto_adjust=True, progress=False)
+                        df = pd.DataFrame()
+                        if not fiat_batch.empty:
+                            if isinstance(fiat_batch.columns, pd.MultiIndex):
+                                if ticker in fiat_batch.columns.get_level_values(0):
+                                    df = fiat_batch[ticker].dropna(how="all")
+                            else:
+                                df = fiat_batch.dropna(how="all")
                         if df.empty:
                             ticker_inv = f"{self.base_currency}{code}=X"
-                            df_inv = yf.download(ticker_inv, start=self.start_date, end=self.end_date, auto_adjust=True, progress=False)
+                            df_inv = yf.download(ticker_inv, start=self._start_iso, end=self._end_iso, auto_adjust=True, progress=False)
                             if not df_inv.empty:
                                 df = df_inv
                                 df["Close"] = 1.0 / df["Close"]
@@ -239,15 +395,13 @@ class DataWorker(QThread):
                             avg_rate = None
                             hist_df = pd.DataFrame()
                 except Exception as e:
-                    self.log.emit(f"Failed loading fiat {name}: {e}")
+                    self._log(f"Failed loading fiat {name}: {e}")
                     avg_rate = None
                     hist_df = pd.DataFrame()
 
-                try:
-                    save_fiat_cache(code, hist_df)
-                    self.log.emit(f"Saved cache for fiat {name}")
-                except Exception as e:
-                    self.log.emit(f"Failed saving cache for fiat {name}: {e}")
+                # the synthetic base==code frame is all 1.0s — never persist it
+                if not hist_df.empty and code != self.base_currency:
+                    self._write_q.put(("fiat", code, hist_df))
 
                 result["fiats"].append({
                     "code": code,
@@ -258,10 +412,23 @@ class DataWorker(QThread):
 
                 self.progress.emit(total_coins + idx + 1, total_steps)
 
+            self._write_q.put(None)
+            self._writer.join()
+            self._log("Cache writes complete")
+
+            self._flush_log()
             self.finished.emit(result)
         except Exception as e:
             tb = traceback.format_exc()
+            self._flush_log()
             self.error.emit(f"Error fetching data: {e}\n{tb}")
+        finally:
+            if self._writer.is_alive():
+                self._write_q.put(None)
+                self._writer.join()
+            self._log_stop.set()
+            self._flusher.join()
+            self._flush_log()
 
     def stop(self):
         self._stopped = True
@@ -388,30 +555,68 @@ class MarketApp(QWidget):
         self.log_widget.append("Load finished.")
 
     def populate_crypto_table(self, cryptos):
-        self.crypto_table.setRowCount(len(cryptos))
-        for row, coin in enumerate(cryptos):
-            name_item = QTableWidgetItem(coin.get("name", ""))
-            avg = coin.get("avg_price")
-            avg_str = f"{avg:,.4f}" if avg is not None else "N/A"
-            avg_item = QTableWidgetItem(f"{avg_str} {self.base_select.currentText()}" if avg is not None else "N/A")
-            self.crypto_table.setItem(row, 0, name_item)
-            self.crypto_table.setItem(row, 1, avg_item)
-            btn = QPushButton("📈 View Chart")
-            btn.clicked.connect(lambda _, c=coin: self.plot_crypto(c))
-            self.crypto_table.setCellWidget(row, 2, btn)
+        table = self.crypto_table
+        currency = self.base_select.currentText()
+        fmt = "{:,.4f} {}".format
+        was_sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setSortingEnabled(False)
+        try:
+            table.setRowCount(len(cryptos))
+            for row, coin in enumerate(cryptos):
+                name_item = QTableWidgetItem(coin.get("name", ""))
+                avg = coin.get("avg_price")
+                avg_item = QTableWidgetItem(fmt(avg, currency) if avg is not None else "N/A")
+                table.setItem(row, 0, name_item)
+                table.setItem(row, 1, avg_item)
+                btn = QPushButton("📈 View Chart")
+                # close over the id only so reloads can free old history frames
+                btn.clicked.connect(lambda _, cid=coin.get("id"): self.plot_crypto_by_id(cid))
+                table.setCellWidget(row, 2, btn)
+        finally:
+            table.setSortingEnabled(was_sorting)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
 
     def populate_fiat_table(self, fiats):
-        self.fiat_table.setRowCount(len(fiats))
-        for row, cur in enumerate(fiats):
-            name_item = QTableWidgetItem(f"{cur.get('name')} ({cur.get('code')})")
-            avg = cur.get("avg_rate")
-            avg_str = f"{avg:,.6f}" if avg is not None else "N/A"
-            avg_item = QTableWidgetItem(avg_str if avg is not None else "N/A")
-            self.fiat_table.setItem(row, 0, name_item)
-            self.fiat_table.setItem(row, 1, avg_item)
-            btn = QPushButton("📈 View Chart")
-            btn.clicked.connect(lambda _, c=cur: self.plot_fiat(c))
-            self.fiat_table.setCellWidget(row, 2, btn)
+        table = self.fiat_table
+        fmt = "{:,.6f}".format
+        was_sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setSortingEnabled(False)
+        try:
+            table.setRowCount(len(fiats))
+            for row, cur in enumerate(fiats):
+                name_item = QTableWidgetItem(f"{cur.get('name')} ({cur.get('code')})")
+                avg = cur.get("avg_rate")
+                avg_item = QTableWidgetItem(fmt(avg) if avg is not None else "N/A")
+                table.setItem(row, 0, name_item)
+                table.setItem(row, 1, avg_item)
+                btn = QPushButton("📈 View Chart")
+                btn.clicked.connect(lambda _, c=cur.get("code"): self.plot_fiat_by_code(c))
+                table.setCellWidget(row, 2, btn)
+        finally:
+            table.setSortingEnabled(was_sorting)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
+    def plot_crypto_by_id(self, coin_id):
+        if not self.data:
+            return
+        for coin in self.data.get("cryptos", []):
+            if coin.get("id") == coin_id:
+                self.plot_crypto(coin)
+                return
+
+    def plot_fiat_by_code(self, code):
+        if not self.data:
+            return
+        for cur in self.data.get("fiats", []):
+            if cur.get("code") == code:
+                self.plot_fiat(cur)
+                return
 
     def plot_crypto(self, coin):
         df = coin.get("history", pd.DataFrame())
@@ -419,22 +624,23 @@ class MarketApp(QWidget):
         end = self.end_date.date().toPyDate()
         currency = self.base_select.currentText()
         if df.empty:
-            df = load_crypto_cache(coin.get("id"), start, end)
+            df = load_crypto_cache(coin.get("id"), start, end, currency.lower())
         if df.empty:
             QMessageBox.information(self, "No data", "No historical data available for this crypto in the selected period (and cache).")
             return
         if "timestamp" in df.columns:
-            x = pd.to_datetime(df["timestamp"])
+            x = pd.to_datetime(df["timestamp"], cache=True)
             y = pd.to_numeric(df.get("price", df.iloc[:, 1] if df.shape[1]>=2 else df.iloc[:,0]), errors="coerce")
         else:
-            x = pd.to_datetime(df.iloc[:,0])
+            x = pd.to_datetime(df.iloc[:,0], cache=True)
             y = pd.to_numeric(df.iloc[:,1], errors="coerce")
         y = y.dropna()
         if y.empty:
             QMessageBox.information(self, "No numeric data", "Historical data exists but contains no numeric values to plot.")
             return
         self.ax.clear()
-        self.ax.plot(x.iloc[:len(y)], y, linewidth=1.2)
+        x_plot, y_plot = decimate_for_plot(x.iloc[:len(y)], y)
+        self.ax.plot(x_plot, y_plot, linewidth=1.2)
         self.ax.set_title(f"{coin.get('name')} price ({currency})")
         self.ax.set_ylabel(f"Price ({currency})")
         self.ax.set_xlabel("Date")
@@ -458,10 +664,10 @@ class MarketApp(QWidget):
             return
 
         if "Date" in df.columns:
-            x = pd.to_datetime(df["Date"])
+            x = pd.to_datetime(df["Date"], cache=True)
             y = pd.to_numeric(df.get("Close", df.iloc[:, 1] if df.shape[1]>=2 else df.iloc[:, 0]), errors="coerce")
         else:
-            x = pd.to_datetime(df.iloc[:,0])
+            x = pd.to_datetime(df.iloc[:,0], cache=True)
             y = pd.to_numeric(df.iloc[:,1], errors="coerce")
         y = y.dropna()
         if y.empty:
@@ -469,7 +675,8 @@ class MarketApp(QWidget):
             return
 
         self.ax.clear()
-        self.ax.plot(x.iloc[:len(y)], y, linewidth=1.2)
+        x_plot, y_plot = decimate_for_plot(x.iloc[:len(y)], y)
+        self.ax.plot(x_plot, y_plot, linewidth=1.2)
         self.ax.set_title(f"{cur.get('name')} rate ({currency})")
         self.ax.set_ylabel(f"Rate ({currency})")
         self.ax.set_xlabel("Date")